@@ -4,14 +4,58 @@ Implements DSA and ECDSA signature generation with step-by-step explanations
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import concurrent.futures
+import functools
+import gzip
 import hashlib
-import secrets
-from typing import Dict, List, Tuple, Any
+import os
+from typing import Dict, List, Optional, Tuple, Union, Any
+
+# gmpy2 is optional: when installed, GMP handles the bignum hot paths.
+# Educational inputs are converted to mpz once, so all further arithmetic
+# stays in GMP; without gmpy2, mpz is simply int.
+try:
+    import gmpy2
+    from gmpy2 import mpz
+except ImportError:
+    gmpy2 = None
+    mpz = int
+
+# cryptography backs the production ECDSA endpoints; imported once here
+# instead of on every request
+try:
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature, encode_dss_signature
+    from cryptography.exceptions import InvalidSignature
+except ImportError:
+    ec = None
+
+
+class CryptoJSONProvider(DefaultJSONProvider):
+    """JSON provider that also serializes gmpy2 integers (as plain numbers)"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, mpz):
+            return int(o)
+        return DefaultJSONProvider.default(o)
+
 
 app = Flask(__name__)
+app.json = CryptoJSONProvider(app)
 CORS(app)  # Enable CORS for React frontend
 
+# hashlib.sha256 dispatches to OpenSSL, which uses the CPU's SHA extensions
+# (SHA-NI on x86-64, ARMv8 crypto) when present. Python builds without
+# OpenSSL fall back to a much slower built-in implementation.
+if hashlib.sha256.__name__ != 'openssl_sha256':
+    app.logger.warning('hashlib.sha256 is not backed by OpenSSL; message hashing will be slower')
+
 
 # ============================================================================
 # MATHEMATICAL UTILITIES
@@ -21,44 +65,225 @@ def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
     """
     Extended Euclidean Algorithm
     Returns (gcd, x, y) such that ax + by = gcd(a, b)
+
+    Kept for teaching purposes; mod_inverse no longer relies on it.
+    Iterative, so large inputs do not build up a deep call stack.
     """
-    if a == 0:
-        return b, 0, 1
-    gcd, x1, y1 = extended_gcd(b % a, a)
-    x = y1 - (b // a) * x1
-    y = x1
-    return gcd, x, y
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_x, x = x, old_x - quotient * x
+        old_y, y = y, old_y - quotient * y
+    return old_r, old_x, old_y
+
+
+if gmpy2 is not None:
+    def _invert(a: int, m: int) -> int:
+        return gmpy2.invert(a, m)
+else:
+    def _invert(a: int, m: int) -> int:
+        return pow(a, -1, m)
 
 
 def mod_inverse(a: int, m: int) -> int:
     """
     Compute modular multiplicative inverse of a modulo m
     Returns x such that (a * x) % m == 1
+
+    Uses gmpy2.invert when available, otherwise CPython's built-in
+    pow(a, -1, m), both of which run the extended Euclidean algorithm in C.
+    For 256-bit moduli this is several times faster than Fermat's
+    pow(a, m - 2, m), so there is no exponentiation-based variant.
     """
-    gcd, x, _ = extended_gcd(a % m, m)
-    if gcd != 1:
+    try:
+        return _invert(a % m, m)
+    except (ValueError, ZeroDivisionError):
         raise ValueError(f"Modular inverse does not exist for {a} mod {m}")
-    return (x % m + m) % m
+
+
+if gmpy2 is not None:
+    def _pow(base: int, exp: int, mod: int) -> int:
+        return gmpy2.powmod(base, exp, mod)
+else:
+    _pow = pow
 
 
 def pow_mod(base: int, exp: int, mod: int) -> int:
     """
     Efficient modular exponentiation: (base^exp) % mod
+
+    Uses gmpy2.powmod when available, otherwise CPython's built-in pow.
+    """
+    return _pow(base, exp, mod)
+
+
+PARALLEL_POW_MIN_BITS = 1024
+
+# Two independent modular exponentiations can overlap on separate threads,
+# but only gmpy2 releases the GIL while it computes (CPython's pow does not),
+# and only when the active per-thread context allows it. The worker threads
+# switch that on in their initializer, the calling thread around its own
+# powmod (see pow_mod_pair). With a single CPU there is nothing to overlap,
+# so no executor is created.
+if gmpy2 is not None and (os.cpu_count() or 1) > 1:
+    def _allow_release_gil() -> None:
+        gmpy2.set_context(gmpy2.context(allow_release_gil=True))
+
+    _pow_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=2, initializer=_allow_release_gil)
+else:
+    _pow_executor = None
+
+
+def pow_mod_pair(b1: int, e1: int, b2: int, e2: int, mod: int) -> Tuple[int, int]:
+    """
+    Compute (b1^e1 mod m, b2^e2 mod m)
+
+    For large moduli with gmpy2 available on a multi-core host, the second
+    exponentiation runs on a worker thread while the first runs on the
+    calling thread, both with the GIL released.
+    """
+    if _pow_executor is not None and mod.bit_length() >= PARALLEL_POW_MIN_BITS:
+        future = _pow_executor.submit(pow_mod, b2, e2, mod)
+        with gmpy2.context(allow_release_gil=True):
+            x1 = pow_mod(b1, e1, mod)
+        return x1, future.result()
+    return pow_mod(b1, e1, mod), pow_mod(b2, e2, mod)
+
+
+def multi_pow_mod(b1: int, e1: int, b2: int, e2: int, mod: int) -> int:
+    """
+    Simultaneous exponentiation (Shamir's trick): (b1^e1 × b2^e2) % mod
+
+    Scans both exponents together from the most significant bit, sharing
+    one squaring per bit and multiplying by b1, b2 or b1×b2 from a
+    4-entry table, instead of squaring once per bit for each exponent.
     """
-    return pow(base, exp, mod)
+    table = [1, b1 % mod, b2 % mod, (b1 * b2) % mod]
+    result = 1
+    for i in range(max(e1.bit_length(), e2.bit_length()) - 1, -1, -1):
+        result = (result * result) % mod
+        idx = ((e1 >> i) & 1) | (((e2 >> i) & 1) << 1)
+        if idx:
+            result = (result * table[idx]) % mod
+    return result % mod
 
 
-def hash_message(message: str) -> int:
+def pow_mod_product(b1: int, e1: int, b2: int, e2: int, mod: int) -> int:
+    """
+    Compute (b1^e1 × b2^e2) % mod with the fastest available method
+
+    gmpy2's powmod beats a Python-level loop, so with gmpy2 the two powers
+    are computed separately; otherwise Shamir's trick saves about half
+    the squarings of two built-in pow calls.
+    """
+    if gmpy2 is not None:
+        x1, x2 = pow_mod_pair(b1, e1, b2, e2, mod)
+        return (x1 * x2) % mod
+    return multi_pow_mod(b1, e1, b2, e2, mod)
+
+
+# Only messages up to this many bytes are memoized; longer ones are rehashed
+# (a cache hit would have to hash the key anyway) and never kept in memory
+HASH_CACHE_MAX_BYTES = 256
+
+
+def _sha256_int(data: bytes) -> int:
+    """SHA-256 of data as a big-endian integer"""
+    return int.from_bytes(hashlib.sha256(data).digest(), 'big')
+
+
+_sha256_int_cached = functools.lru_cache(maxsize=1024)(_sha256_int)
+
+
+def hash_message(message: Union[str, bytes]) -> int:
     """
     Hash a message using SHA-256 and convert to integer
+    Accepts text (UTF-8 encoded before hashing) or raw bytes
+
+    Short messages are memoized, so signing and then verifying the same
+    example only hashes it once. The digest bytes go straight to
+    int.from_bytes (no hex round trip); hashlib's OpenSSL SHA-256 already
+    uses the CPU's SHA instructions, so don't replace it with a pure-Python
+    implementation.
+    """
+    data = message if isinstance(message, bytes) else message.encode()
+    if len(data) <= HASH_CACHE_MAX_BYTES:
+        return _sha256_int_cached(data)
+    return _sha256_int(data)
+
+
+def parse_flag(value: Any) -> bool:
+    """
+    Interpret a boolean request option given as a JSON bool/number or a string
+    "0", "false", "no" and "off" (any case) are False, other non-empty strings
+    are True; an empty string or any other type is rejected
     """
-    return int(hashlib.sha256(message.encode()).hexdigest(), 16)
+    if isinstance(value, (bool, int, float)):
+        return bool(value)
+    if isinstance(value, str) and value.strip():
+        return value.strip().lower() not in ('0', 'false', 'no', 'off')
+    raise ValueError(f'Expected a boolean flag, got {value!r}')
 
 
 # ============================================================================
 # DSA IMPLEMENTATION (Educational Mode)
 # ============================================================================
 
+class DSAParams:
+    """
+    DSA domain parameters (p, q, g) with a fixed-base table for powers of g
+
+    g never changes between signatures, so its powers can be precomputed
+    once: table[i][j] = g^(j × 16^i) mod p. Then g^e needs one table lookup
+    and one multiplication per 4-bit window of e, and no squarings at all.
+    """
+    
+    WINDOW_BITS = 4
+    
+    def __init__(self, p: int, q: int, g: int):
+        self.p = p
+        self.q = q
+        self.g = g
+        
+        # Enough windows for any exponent below q
+        width = 1 << self.WINDOW_BITS
+        self.table = []
+        base = g % p
+        for _ in range(-(-q.bit_length() // self.WINDOW_BITS)):
+            row = [1, base]
+            for _ in range(width - 2):
+                row.append((row[-1] * base) % p)
+            self.table.append(row)
+            base = (row[-1] * base) % p  # base^16 for the next window
+    
+    def pow_g(self, e: int) -> int:
+        """Compute g^e mod p using the precomputed table"""
+        if e < 0 or e.bit_length() > len(self.table) * self.WINDOW_BITS:
+            return pow_mod(self.g, e, self.p)
+        
+        p = self.p
+        mask = (1 << self.WINDOW_BITS) - 1
+        result = 1
+        for row in self.table:
+            if not e:
+                break
+            digit = e & mask
+            if digit:
+                result = (result * row[digit]) % p
+            e >>= self.WINDOW_BITS
+        return result % p
+
+
+@functools.lru_cache(maxsize=32)
+def get_dsa_params(p: int, q: int, g: int) -> DSAParams:
+    """Return the (cached) DSAParams for these domain parameters"""
+    return DSAParams(p, q, g)
+
+
 def dsa_educational_sign(params: Dict) -> Dict:
     """
     Educational DSA signature generation with step-by-step explanation
@@ -76,14 +301,16 @@ def dsa_educational_sign(params: Dict) -> Dict:
     - x: private key (1 < x < q) - SECRET
     - k: random nonce (1 < k < q) - MUST be random and never reused
     - message: message to sign
+    - verbose: include the step-by-step explanation (default True)
     """
     # Extract and convert parameters
-    p = int(params['p'])
-    q = int(params['q'])
-    g = int(params['g'])
-    x = int(params['x'])
-    k = int(params['k'])
+    p = mpz(int(params['p']))
+    q = mpz(int(params['q']))
+    g = mpz(int(params['g']))
+    x = mpz(int(params['x']))
+    k = mpz(int(params['k']))
     message = params['message']
+    verbose = parse_flag(params.get('verbose', True))  # False skips building the step-by-step explanation
     
     steps = []
     
@@ -93,15 +320,17 @@ def dsa_educational_sign(params: Dict) -> Dict:
     # Public key: y = g^x mod p
     # This is a one-way function: easy to compute y from x, but hard to find x from y
     # The public key can be shared; it doesn't reveal the private key
-    y = pow_mod(g, x, p)
-    steps.append({
-        'step': 1,
-        'title': 'Compute Public Key',
-        'formula': 'y = g^x mod p',
-        'substitution': f'y = {g}^{x} mod {p}',
-        'result': y,
-        'explanation': 'The public key is derived from the private key using modular exponentiation. This is a one-way function.'
-    })
+    domain = get_dsa_params(p, q, g)
+    y = domain.pow_g(x)
+    if verbose:
+        steps.append({
+            'step': 1,
+            'title': 'Compute Public Key',
+            'formula': 'y = g^x mod p',
+            'substitution': f'y = {g}^{x} mod {p}',
+            'result': y,
+            'explanation': 'The public key is derived from the private key using modular exponentiation. This is a one-way function.'
+        })
     
     # ========================================================================
     # STEP 2: Hash the Message
@@ -110,15 +339,16 @@ def dsa_educational_sign(params: Dict) -> Dict:
     # Reduce modulo q to fit within the subgroup order
     h = hash_message(message)
     h_mod_q = h % q
-    steps.append({
-        'step': 2,
-        'title': 'Hash Message',
-        'formula': 'H(m) mod q',
-        'substitution': f'SHA-256("{message}") mod {q}',
-        'result': h_mod_q,
-        'hash_full': hex(h),
-        'explanation': 'The message is hashed using SHA-256, then reduced modulo q to fit within the group.'
-    })
+    if verbose:
+        steps.append({
+            'step': 2,
+            'title': 'Hash Message',
+            'formula': 'H(m) mod q',
+            'substitution': f'SHA-256("{message}") mod {q}',
+            'result': h_mod_q,
+            'hash_full': hex(h),
+            'explanation': 'The message is hashed using SHA-256, then reduced modulo q to fit within the group.'
+        })
     
     # ========================================================================
     # STEP 3: Compute r (First Part of Signature)
@@ -126,7 +356,7 @@ def dsa_educational_sign(params: Dict) -> Dict:
     # r = (g^k mod p) mod q
     # The nonce k creates randomness - each signature is unique even for same message
     # This prevents signature forgery and protects the private key
-    g_k_mod_p = pow_mod(g, k, p)
+    g_k_mod_p = domain.pow_g(k)
     r = g_k_mod_p % q
     
     # Validation: r must be non-zero (otherwise signature is invalid)
@@ -143,15 +373,16 @@ def dsa_educational_sign(params: Dict) -> Dict:
     # Needed to "undo" the effect of k in the signature equation
     # This is why k must NEVER be reused - if k is known, the private key can be recovered
     k_inv = mod_inverse(k, q)
-    steps.append({
-        'step': 4,
-        'title': 'Compute Modular Inverse of k',
-        'formula': 'k^(-1) mod q',
-        'substitution': f'{k}^(-1) mod {q}',
-        'result': k_inv,
-        'verification': f'({k} × {k_inv}) mod {q} = {(k * k_inv) % q}',
-        'explanation': 'The modular inverse of k is needed to compute s. This is why k must be chosen carefully and never reused.'
-    })
+    if verbose:
+        steps.append({
+            'step': 4,
+            'title': 'Compute Modular Inverse of k',
+            'formula': 'k^(-1) mod q',
+            'substitution': f'{k}^(-1) mod {q}',
+            'result': k_inv,
+            'verification': f'({k} × {k_inv}) mod {q} = {(k * k_inv) % q}',
+            'explanation': 'The modular inverse of k is needed to compute s. This is why k must be chosen carefully and never reused.'
+        })
     
     # ========================================================================
     # STEP 5: Compute s (Second Part of Signature)
@@ -162,24 +393,25 @@ def dsa_educational_sign(params: Dict) -> Dict:
     #   - The private key x (hidden in the computation)
     #   - The randomness r
     # Only someone with private key x can compute a valid s
-    xr = (x * r) % q          # Private key × r
-    h_plus_xr = (h_mod_q + xr) % q  # Hash + (private key × r)
-    s = (k_inv * h_plus_xr) % q     # Final signature component
-    
-    # Validation: s must be non-zero
-    steps.append({
-        'step': 5,
-        'title': 'Compute s',
-        'formula': 's = k^(-1) × (H(m) + x×r) mod q',
-        'substitution': f's = {k_inv} × ({h_mod_q} + {x}×{r}) mod {q}',
-        'intermediate_steps': [
-            f'x×r = {x}×{r} = {xr} mod {q}',
-            f'H(m) + x×r = {h_mod_q} + {xr} = {h_plus_xr} mod {q}',
-            f's = {k_inv}×{h_plus_xr} = {s} mod {q}'
-        ],
-        'result': s,
-        'explanation': 's binds together the hash, private key, and r. Without knowing x, an attacker cannot forge valid signatures.'
-    })
+    s = (k_inv * (h_mod_q + x * r)) % q  # Single reduction for the whole expression
+    
+    if verbose:
+        # Intermediate values are only needed for the step-by-step display
+        xr = (x * r) % q          # Private key × r
+        h_plus_xr = (h_mod_q + xr) % q  # Hash + (private key × r)
+        steps.append({
+            'step': 5,
+            'title': 'Compute s',
+            'formula': 's = k^(-1) × (H(m) + x×r) mod q',
+            'substitution': f's = {k_inv} × ({h_mod_q} + {x}×{r}) mod {q}',
+            'intermediate_steps': [
+                f'x×r = {x}×{r} = {xr} mod {q}',
+                f'H(m) + x×r = {h_mod_q} + {xr} = {h_plus_xr} mod {q}',
+                f's = {k_inv}×{h_plus_xr} = {s} mod {q}'
+            ],
+            'result': s,
+            'explanation': 's binds together the hash, private key, and r. Without knowing x, an attacker cannot forge valid signatures.'
+        })
     
     # Validation: s must be non-zero
     if s == 0:
@@ -224,14 +456,16 @@ def dsa_educational_verify(params: Dict) -> Dict:
     - y: Public key
     - r, s: Signature components
     - message: Original message
+    - verbose: include the step-by-step explanation (default True)
     """
-    p = int(params['p'])
-    q = int(params['q'])
-    g = int(params['g'])
-    y = int(params['y'])
-    r = int(params['r'])
-    s = int(params['s'])
+    p = mpz(int(params['p']))
+    q = mpz(int(params['q']))
+    g = mpz(int(params['g']))
+    y = mpz(int(params['y']))
+    r = mpz(int(params['r']))
+    s = mpz(int(params['s']))
     message = params['message']
+    verbose = parse_flag(params.get('verbose', True))  # False skips building the step-by-step explanation
     
     steps = []
     
@@ -240,90 +474,99 @@ def dsa_educational_verify(params: Dict) -> Dict:
     # ========================================================================
     h = hash_message(message)
     h_mod_q = h % q
-    steps.append({
-        'step': 1,
-        'title': 'Hash Message',
-        'formula': 'H(m) mod q',
-        'substitution': f'SHA-256("{message}") mod {q}',
-        'result': h_mod_q,
-        'hash_full': hex(h),
-        'explanation': 'Hash the message the same way as during signing.'
-    })
+    if verbose:
+        steps.append({
+            'step': 1,
+            'title': 'Hash Message',
+            'formula': 'H(m) mod q',
+            'substitution': f'SHA-256("{message}") mod {q}',
+            'result': h_mod_q,
+            'hash_full': hex(h),
+            'explanation': 'Hash the message the same way as during signing.'
+        })
     
     # ========================================================================
     # STEP 2: Compute w = s^(-1) mod q
     # ========================================================================
     w = mod_inverse(s, q)
-    steps.append({
-        'step': 2,
-        'title': 'Compute w = s^(-1) mod q',
-        'formula': 'w = s^(-1) mod q',
-        'substitution': f'w = {s}^(-1) mod {q}',
-        'result': w,
-        'verification': f'({s} × {w}) mod {q} = {(s * w) % q}',
-        'explanation': 'Compute the modular inverse of s to "undo" its effect.'
-    })
+    if verbose:
+        steps.append({
+            'step': 2,
+            'title': 'Compute w = s^(-1) mod q',
+            'formula': 'w = s^(-1) mod q',
+            'substitution': f'w = {s}^(-1) mod {q}',
+            'result': w,
+            'verification': f'({s} × {w}) mod {q} = {(s * w) % q}',
+            'explanation': 'Compute the modular inverse of s to "undo" its effect.'
+        })
     
     # ========================================================================
     # STEP 3: Compute u₁ = H(m) × w mod q
     # ========================================================================
     u1 = (h_mod_q * w) % q
-    steps.append({
-        'step': 3,
-        'title': 'Compute u₁',
-        'formula': 'u₁ = H(m) × w mod q',
-        'substitution': f'u₁ = {h_mod_q} × {w} mod {q}',
-        'result': u1,
-        'explanation': 'First verification component combines message hash and w.'
-    })
+    if verbose:
+        steps.append({
+            'step': 3,
+            'title': 'Compute u₁',
+            'formula': 'u₁ = H(m) × w mod q',
+            'substitution': f'u₁ = {h_mod_q} × {w} mod {q}',
+            'result': u1,
+            'explanation': 'First verification component combines message hash and w.'
+        })
     
     # ========================================================================
     # STEP 4: Compute u₂ = r × w mod q
     # ========================================================================
     u2 = (r * w) % q
-    steps.append({
-        'step': 4,
-        'title': 'Compute u₂',
-        'formula': 'u₂ = r × w mod q',
-        'substitution': f'u₂ = {r} × {w} mod {q}',
-        'result': u2,
-        'explanation': 'Second verification component combines r and w.'
-    })
+    if verbose:
+        steps.append({
+            'step': 4,
+            'title': 'Compute u₂',
+            'formula': 'u₂ = r × w mod q',
+            'substitution': f'u₂ = {r} × {w} mod {q}',
+            'result': u2,
+            'explanation': 'Second verification component combines r and w.'
+        })
     
     # ========================================================================
     # STEP 5: Compute v = (g^(u₁) × y^(u₂) mod p) mod q
     # ========================================================================
-    g_u1 = pow_mod(g, u1, p)
-    y_u2 = pow_mod(y, u2, p)
-    g_y_product = (g_u1 * y_u2) % p
+    if verbose:
+        # Keep the two powers separate so each can be shown
+        g_u1, y_u2 = pow_mod_pair(g, u1, y, u2, p)
+        g_y_product = (g_u1 * y_u2) % p
+    else:
+        g_y_product = pow_mod_product(g, u1, y, u2, p)
     v = g_y_product % q
-    steps.append({
-        'step': 5,
-        'title': 'Compute v',
-        'formula': 'v = (g^(u₁) × y^(u₂) mod p) mod q',
-        'substitution': f'v = ({g}^{u1} × {y}^{u2} mod {p}) mod {q}',
-        'intermediate_steps': [
-            f'g^(u₁) mod p = {g}^{u1} mod {p} = {g_u1}',
-            f'y^(u₂) mod p = {y}^{u2} mod {p} = {y_u2}',
-            f'g^(u₁) × y^(u₂) mod p = {g_u1} × {y_u2} mod {p} = {g_y_product}',
-            f'v = {g_y_product} mod {q} = {v}'
-        ],
-        'result': v,
-        'explanation': 'This reconstructs the r value from the signature components.'
-    })
+    if verbose:
+        steps.append({
+            'step': 5,
+            'title': 'Compute v',
+            'formula': 'v = (g^(u₁) × y^(u₂) mod p) mod q',
+            'substitution': f'v = ({g}^{u1} × {y}^{u2} mod {p}) mod {q}',
+            'intermediate_steps': [
+                f'g^(u₁) mod p = {g}^{u1} mod {p} = {g_u1}',
+                f'y^(u₂) mod p = {y}^{u2} mod {p} = {y_u2}',
+                f'g^(u₁) × y^(u₂) mod p = {g_u1} × {y_u2} mod {p} = {g_y_product}',
+                f'v = {g_y_product} mod {q} = {v}'
+            ],
+            'result': v,
+            'explanation': 'This reconstructs the r value from the signature components.'
+        })
     
     # ========================================================================
     # STEP 6: Verify v = r
     # ========================================================================
     is_valid = (v == r)
-    steps.append({
-        'step': 6,
-        'title': 'Verify Signature',
-        'formula': 'v = r?',
-        'substitution': f'{v} = {r}?',
-        'result': '✅ VALID' if is_valid else '❌ INVALID',
-        'explanation': 'Signature is valid if v equals r. This proves the signature was created by someone with the private key.'
-    })
+    if verbose:
+        steps.append({
+            'step': 6,
+            'title': 'Verify Signature',
+            'formula': 'v = r?',
+            'substitution': f'{v} = {r}?',
+            'result': '✅ VALID' if is_valid else '❌ INVALID',
+            'explanation': 'Signature is valid if v equals r. This proves the signature was created by someone with the private key.'
+        })
     
     return {
         'success': True,
@@ -340,6 +583,92 @@ def dsa_educational_verify(params: Dict) -> Dict:
 # ELLIPTIC CURVE UTILITIES
 # ============================================================================
 
+def wnaf_digits(k: int, w: int) -> List[int]:
+    """
+    Width-w non-adjacent form of k, least significant digit first
+
+    Every non-zero digit is odd and lies in (-2^(w-1), 2^(w-1)), and any
+    w consecutive digits contain at most one non-zero value, so a scalar
+    multiplication only needs about log₂(k)/(w+1) point additions.
+    """
+    digits = []
+    window = 1 << w
+    half = window >> 1
+    while k > 0:
+        if k & 1:
+            d = k & (window - 1)
+            if d >= half:
+                d -= window
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
+# ----------------------------------------------------------------------------
+# Jacobian projective coordinates: (X, Y, Z) represents (X/Z², Y/Z³)
+# ----------------------------------------------------------------------------
+# Additions and doublings need no modular inverse; only the final conversion
+# back to affine coordinates does. Coordinates are passed as plain integers
+# and Z = 0 marks the point at infinity, so no point objects are allocated.
+
+def _jacobian_double(X: int, Y: int, Z: int, a: int, p: int) -> Tuple[int, int, int]:
+    """Double a point in Jacobian coordinates"""
+    if Y == 0 or Z == 0:
+        return 1, 1, 0
+    YY = Y * Y % p
+    S = 4 * X * YY % p
+    ZZ = Z * Z % p
+    M = (3 * X * X + a * ZZ * ZZ) % p
+    X3 = (M * M - 2 * S) % p
+    Y3 = (M * (S - X3) - 8 * YY * YY) % p
+    Z3 = 2 * Y * Z % p
+    return X3, Y3, Z3
+
+
+def _jacobian_add(X1: int, Y1: int, Z1: int, X2: int, Y2: int, Z2: int,
+                  a: int, p: int) -> Tuple[int, int, int]:
+    """Add two points in Jacobian coordinates"""
+    if Z1 == 0:
+        return X2, Y2, Z2
+    if Z2 == 0:
+        return X1, Y1, Z1
+    Z1Z1 = Z1 * Z1 % p
+    Z2Z2 = Z2 * Z2 % p
+    U1 = X1 * Z2Z2 % p
+    U2 = X2 * Z1Z1 % p
+    S1 = Y1 * Z2 * Z2Z2 % p
+    S2 = Y2 * Z1 * Z1Z1 % p
+    if U1 == U2:
+        # Same x-coordinate: either P = Q (double) or P = -Q (infinity)
+        if S1 != S2:
+            return 1, 1, 0
+        return _jacobian_double(X1, Y1, Z1, a, p)
+    H = (U2 - U1) % p
+    R = (S2 - S1) % p
+    HH = H * H % p
+    HHH = H * HH % p
+    U1HH = U1 * HH % p
+    X3 = (R * R - HHH - 2 * U1HH) % p
+    Y3 = (R * (U1HH - X3) - S1 * HHH) % p
+    Z3 = H * Z1 * Z2 % p
+    return X3, Y3, Z3
+
+
+# Affine point (x, y) on an elliptic curve; None stands for the point at infinity.
+# Plain tuples keep point arithmetic cheap and serialize to JSON as [x, y].
+Point = Tuple[int, int]
+
+
+def format_point(P: Point) -> str:
+    """Render a point as (x, y) for the step explanations (plain numbers, also for mpz)"""
+    if P is None:
+        return 'None'
+    return f'({P[0]}, {P[1]})'
+
+
 class EllipticCurve:
     """
     Represents an elliptic curve y² = x³ + ax + b (mod p)
@@ -350,13 +679,15 @@ class EllipticCurve:
     - This hardness provides cryptographic security
     """
     
+    FIXED_BASE_WINDOW_BITS = 4
+    
     def __init__(self, a: int, b: int, p: int):
         """Initialize curve with parameters a, b, and prime modulus p"""
-        self.a = a
-        self.b = b
-        self.p = p
+        self.a = mpz(a)
+        self.b = mpz(b)
+        self.p = mpz(p)
         
-    def is_on_curve(self, point: Tuple[int, int]) -> bool:
+    def is_on_curve(self, point: Point) -> bool:
         """
         Check if a point (x, y) satisfies the curve equation: y² = x³ + ax + b (mod p)
         Returns True if point is on curve or is point at infinity
@@ -365,9 +696,10 @@ class EllipticCurve:
             return True
         x, y = point
         # Check: y² ≡ x³ + ax + b (mod p)
-        return (y * y - (x**3 + self.a * x + self.b)) % self.p == 0
+        # pow(x, 3, p) reduces as it goes instead of building the full x³
+        return (y * y - (pow(x, 3, self.p) + self.a * x + self.b)) % self.p == 0
     
-    def point_add(self, P: Tuple[int, int], Q: Tuple[int, int]) -> Tuple[int, int]:
+    def point_add(self, P: Point, Q: Point) -> Point:
         """
         Add two points on the elliptic curve using the group law
         Returns the sum P + Q
@@ -395,8 +727,9 @@ class EllipticCurve:
                 return None  # Point at infinity
             
             # Slope for doubling: λ = (3x₁² + a) / (2y₁) mod p
-            numerator = (3 * x1 * x1 + self.a) % self.p
-            denominator = (2 * y1) % self.p
+            # (mod_inverse and the final % p take care of reducing the parts)
+            numerator = 3 * x1 * x1 + self.a
+            denominator = 2 * y1
             lam = (numerator * mod_inverse(denominator, self.p)) % self.p
         else:
             # Case 2: Point addition (P + Q where P ≠ Q)
@@ -405,8 +738,8 @@ class EllipticCurve:
                 return None  # Point at infinity
             
             # Slope for addition: λ = (y₂ - y₁) / (x₂ - x₁) mod p
-            numerator = (y2 - y1) % self.p
-            denominator = (x2 - x1) % self.p
+            numerator = y2 - y1
+            denominator = x2 - x1
             lam = (numerator * mod_inverse(denominator, self.p)) % self.p
         
         # Compute result point: (x₃, y₃)
@@ -417,7 +750,8 @@ class EllipticCurve:
         
         return (x3, y3)
     
-    def scalar_multiply(self, k: int, P: Tuple[int, int], show_steps: bool = False) -> Any:
+    def scalar_multiply(self, k: int, P: Point, show_steps: bool = False,
+                        max_steps: Optional[int] = None) -> Any:
         """
         Scalar multiplication: k × P using double-and-add algorithm
         
@@ -435,54 +769,211 @@ class EllipticCurve:
         - Bit 1 (0): result = P, temp = 4P  
         - Bit 2 (1): result = P + 4P = 5P, temp = 8P
         
-        If show_steps=True, returns (result, steps) for educational purposes
+        If show_steps=True, runs the double-and-add above and returns
+        (result, steps, total_steps) for educational purposes: steps holds the
+        recorded steps (only the first max_steps of them when max_steps is set,
+        the rest are counted but never built), total_steps counts all of them.
+        Otherwise only the point is returned, computed with the faster
+        scalar_multiply_jacobian.
         """
         # Edge cases
         if k == 0 or P is None:
-            return None if not show_steps else (None, [])
+            if not show_steps:
+                return None
+            return None, [], 0
         
         if k < 0:
             raise ValueError("Negative scalar not supported in this educational implementation")
         
-        # Convert k to binary for double-and-add algorithm
-        binary = bin(k)[2:]  # Remove '0b' prefix
+        if not show_steps:
+            return self.scalar_multiply_jacobian(k, P)
         
-        if show_steps:
-            steps = []
-            steps.append({
-                'info': f'Converting scalar k={k} to binary: {binary}',
-                'explanation': 'We use the double-and-add algorithm, processing bits from least to most significant'
-            })
+        nbits = k.bit_length()
+        steps = []
+        total_steps = 1
+        steps.append({
+            'info': f'Converting scalar k={k} to binary: {bin(k)[2:]}',
+            'explanation': 'We use the double-and-add algorithm, processing bits from least to most significant'
+        })
         
         result = None  # Accumulator for final result
         temp = P       # Current point being doubled
         
         # Process each bit of k from least significant to most
-        for i, bit in enumerate(reversed(binary)):
-            if show_steps:
+        for i in range(nbits):
+            bit = (k >> i) & 1
+            # Past max_steps only count the step, don't build (and format) it
+            record = max_steps is None or len(steps) < max_steps
+            if record:
                 step_info = {
                     'iteration': i,
-                    'bit': bit,
+                    'bit': str(bit),
                     'bit_position': f'2^{i}',
                 }
             
             # If bit is 1, add current point to result
-            if bit == '1':
+            if bit:
                 result = self.point_add(result, temp)
-                if show_steps:
+                total_steps += 1
+                if record:
                     step_info['operation'] = 'Add'
-                    step_info['detail'] = f'Result = Result + {temp}'
+                    step_info['detail'] = f'Result = Result + {format_point(temp)}'
                     step_info['result'] = result
                     steps.append(step_info)
             
             # Double the current point for next iteration (except on last iteration)
-            if i < len(binary) - 1:  # Don't double on the last iteration
+            if i < nbits - 1:  # Don't double on the last iteration
                 temp = self.point_add(temp, temp)
-                if show_steps and bit == '0':
-                    step_info['operation'] = 'Skip (bit=0)'
-                    steps.append(step_info)
+                if not bit:
+                    total_steps += 1
+                    if record:
+                        step_info['operation'] = 'Skip (bit=0)'
+                        steps.append(step_info)
         
-        return (result, steps) if show_steps else result
+        return result, steps, total_steps
+    
+    def _from_jacobian(self, X: int, Y: int, Z: int) -> Point:
+        """Convert Jacobian (X, Y, Z) back to affine coordinates with a single modular inverse"""
+        if Z == 0:
+            return None
+        p = self.p
+        z_inv = mod_inverse(Z, p)
+        z_inv2 = z_inv * z_inv % p
+        return (X * z_inv2 % p, Y * z_inv2 * z_inv % p)
+    
+    def _jacobian_odd_multiples(self, P: Point, w: int) -> List[Tuple[int, int, int]]:
+        """wNAF table in Jacobian coordinates: table[i] = (2i + 1) × P, for i < 2^(w-2)"""
+        a, p = self.a, self.p
+        X, Y, Z = P[0] % p, P[1] % p, 1
+        dX, dY, dZ = _jacobian_double(X, Y, Z, a, p)
+        table = [(X, Y, Z)]
+        for _ in range((1 << (w - 2)) - 1):
+            X, Y, Z = _jacobian_add(X, Y, Z, dX, dY, dZ, a, p)
+            table.append((X, Y, Z))
+        return table
+    
+    def scalar_multiply_jacobian(self, k: int, P: Point, w: int = 4) -> Point:
+        """
+        Scalar multiplication k × P in Jacobian coordinates
+
+        Precomputes the odd multiples P, 3P, 5P, ..., (2^(w-1) - 1)P, then
+        walks the wNAF digits of k from most to least significant: double
+        on every digit, add or subtract a table entry on non-zero digits.
+        Negating a point is free ((X, Y, Z) → (X, -Y, Z)), so negative digits
+        cost the same as positive ones. Every intermediate point is kept in
+        Jacobian form, so the whole computation costs one modular inverse
+        instead of one per point operation. The accumulator lives in
+        three local integers rather than being re-packed into a point object
+        after every operation.
+        """
+        if k < 0:
+            raise ValueError("Negative scalar not supported in this educational implementation")
+        if k == 0 or P is None:
+            return None
+        a, p = self.a, self.p
+        table = self._jacobian_odd_multiples(P, w)
+        
+        rX, rY, rZ = 1, 1, 0  # Point at infinity
+        for d in reversed(wnaf_digits(k, w)):
+            rX, rY, rZ = _jacobian_double(rX, rY, rZ, a, p)
+            if d > 0:
+                tX, tY, tZ = table[d >> 1]
+                rX, rY, rZ = _jacobian_add(rX, rY, rZ, tX, tY, tZ, a, p)
+            elif d < 0:
+                tX, tY, tZ = table[(-d) >> 1]
+                rX, rY, rZ = _jacobian_add(rX, rY, rZ, tX, -tY % p, tZ, a, p)
+        return self._from_jacobian(rX, rY, rZ)
+    
+    def shamir_mul(self, u1: int, P: Point, u2: int, Q: Point, w: int = 5) -> Point:
+        """
+        Compute u1 × P + u2 × Q with Shamir's trick (Straus' method)
+
+        Both scalars are recoded to width-w NAF and scanned together from
+        the most significant digit: one doubling per digit shared by both
+        terms, plus an addition or subtraction from the odd-multiples table
+        of P or Q on each non-zero digit. With w = 5 that is about one
+        addition every six digits per scalar, instead of one per set bit.
+        Jacobian coordinates keep modular inverses out of the loop.
+        """
+        if u1 < 0 or u2 < 0:
+            raise ValueError("Negative scalar not supported in this educational implementation")
+        a, p = self.a, self.p
+        
+        terms = [(self._jacobian_odd_multiples(point, w), wnaf_digits(u, w))
+                 for u, point in ((u1, P), (u2, Q)) if u and point is not None]
+        
+        rX, rY, rZ = 1, 1, 0  # Point at infinity
+        for i in range(max((len(digits) for _, digits in terms), default=0) - 1, -1, -1):
+            rX, rY, rZ = _jacobian_double(rX, rY, rZ, a, p)
+            for table, digits in terms:
+                d = digits[i] if i < len(digits) else 0
+                if d > 0:
+                    tX, tY, tZ = table[d >> 1]
+                    rX, rY, rZ = _jacobian_add(rX, rY, rZ, tX, tY, tZ, a, p)
+                elif d < 0:
+                    tX, tY, tZ = table[(-d) >> 1]
+                    rX, rY, rZ = _jacobian_add(rX, rY, rZ, tX, -tY % p, tZ, a, p)
+        return self._from_jacobian(rX, rY, rZ)
+    
+    def fixed_base_table(self, G: Point, n: int) -> List[List[Tuple[int, int, int]]]:
+        """
+        Precompute table[i][j] = j × 16^i × G (Jacobian) for scalars below 2^bits(n)
+
+        Built once per base point (see get_fixed_base_table); afterwards a
+        scalar multiplication of G needs one addition per 4-bit window of
+        the scalar and no doublings.
+        """
+        a, p = self.a, self.p
+        width = 1 << self.FIXED_BASE_WINDOW_BITS
+        table = []
+        bX, bY, bZ = G[0] % p, G[1] % p, 1
+        for _ in range(-(-n.bit_length() // self.FIXED_BASE_WINDOW_BITS)):
+            row = [(1, 1, 0), (bX, bY, bZ)]
+            X, Y, Z = bX, bY, bZ
+            for _ in range(width - 2):
+                X, Y, Z = _jacobian_add(X, Y, Z, bX, bY, bZ, a, p)
+                row.append((X, Y, Z))
+            table.append(row)
+            bX, bY, bZ = _jacobian_add(X, Y, Z, bX, bY, bZ, a, p)  # 16 × base for the next window
+        return table
+    
+    def fixed_base_mul(self, k: int, G: Point, table: List[List[Tuple[int, int, int]]]) -> Point:
+        """
+        Scalar multiplication k × G using a table from fixed_base_table
+
+        Falls back to scalar_multiply_jacobian for scalars too large for the table.
+        """
+        if k < 0:
+            raise ValueError("Negative scalar not supported in this educational implementation")
+        if k == 0 or G is None:
+            return None
+        if k.bit_length() > len(table) * self.FIXED_BASE_WINDOW_BITS:
+            return self.scalar_multiply_jacobian(k, G)
+        
+        a, p = self.a, self.p
+        mask = (1 << self.FIXED_BASE_WINDOW_BITS) - 1
+        rX, rY, rZ = 1, 1, 0  # Point at infinity
+        for row in table:
+            if not k:
+                break
+            digit = k & mask
+            if digit:
+                tX, tY, tZ = row[digit]
+                rX, rY, rZ = _jacobian_add(rX, rY, rZ, tX, tY, tZ, a, p)
+            k >>= self.FIXED_BASE_WINDOW_BITS
+        return self._from_jacobian(rX, rY, rZ)
+
+
+@functools.lru_cache(maxsize=32)
+def get_curve(a: int, b: int, p: int) -> EllipticCurve:
+    """Return the (cached) curve y² = x³ + ax + b (mod p); EllipticCurve holds no per-request state"""
+    return EllipticCurve(a, b, p)
+
+
+@functools.lru_cache(maxsize=32)
+def get_fixed_base_table(a: int, b: int, p: int, Gx: int, Gy: int, n: int) -> List[List[Tuple[int, int, int]]]:
+    """Return the (cached) fixed-base table for generator G on curve (a, b, p)"""
+    return get_curve(a, b, p).fixed_base_table((Gx, Gy), n)
 
 
 # ============================================================================
@@ -508,17 +999,19 @@ def ecdsa_educational_sign(params: Dict) -> Dict:
     - d: private key (1 < d < n) - SECRET
     - k: random nonce (1 < k < n) - MUST be random and never reused
     - message: message to sign
+    - verbose: include the step-by-step explanation (default True)
     """
     # Extract and convert parameters
-    a = int(params['a'])
-    b = int(params['b'])
-    p = int(params['p'])
-    Gx = int(params['Gx'])
-    Gy = int(params['Gy'])
-    n = int(params['n'])
-    d = int(params['d'])
-    k = int(params['k'])
+    a = mpz(int(params['a']))
+    b = mpz(int(params['b']))
+    p = mpz(int(params['p']))
+    Gx = mpz(int(params['Gx']))
+    Gy = mpz(int(params['Gy']))
+    n = mpz(int(params['n']))
+    d = mpz(int(params['d']))
+    k = mpz(int(params['k']))
     message = params['message']
+    verbose = parse_flag(params.get('verbose', True))  # False skips building the step-by-step explanation
     
     steps = []
     
@@ -528,7 +1021,7 @@ def ecdsa_educational_sign(params: Dict) -> Dict:
     # Elliptic curves provide a mathematical structure for cryptography
     # The curve equation: y² = x³ + ax + b (mod p)
     # Points on the curve form a group under point addition
-    curve = EllipticCurve(a, b, p)
+    curve = get_curve(a, b, p)
     G = (Gx, Gy)
     
     # Validation: Generator point must be on the curve
@@ -538,15 +1031,16 @@ def ecdsa_educational_sign(params: Dict) -> Dict:
             'steps': []
         }
     
-    steps.append({
-        'step': 0,
-        'title': 'Curve Definition',
-        'curve_equation': f'y² = x³ + {a}x + {b} (mod {p})',
-        'generator': f'G = ({Gx}, {Gy})',
-        'order': f'n = {n}',
-        'verification': f'G is on the curve: {Gy}² mod {p} = ({Gx}³ + {a}×{Gx} + {b}) mod {p}',
-        'explanation': 'The elliptic curve and generator point define the cryptographic group we work in.'
-    })
+    if verbose:
+        steps.append({
+            'step': 0,
+            'title': 'Curve Definition',
+            'curve_equation': f'y² = x³ + {a}x + {b} (mod {p})',
+            'generator': f'G = ({Gx}, {Gy})',
+            'order': f'n = {n}',
+            'verification': f'G is on the curve: {Gy}² mod {p} = ({Gx}³ + {a}×{Gx} + {b}) mod {p}',
+            'explanation': 'The elliptic curve and generator point define the cryptographic group we work in.'
+        })
     
     # ========================================================================
     # STEP 1: Compute Public Key
@@ -555,17 +1049,23 @@ def ecdsa_educational_sign(params: Dict) -> Dict:
     # This is a one-way function: easy to compute Q from d, but hard to find d from Q
     # The security relies on the Elliptic Curve Discrete Logarithm Problem (ECDLP)
     # The public key can be shared; it doesn't reveal the private key
-    Q, mult_steps = curve.scalar_multiply(d, G, show_steps=True)
-    steps.append({
-        'step': 1,
-        'title': 'Compute Public Key',
-        'formula': 'Q = d × G',
-        'substitution': f'Q = {d} × ({Gx}, {Gy})',
-        'result': Q,
-        'scalar_multiplication_steps': mult_steps[:5] if len(mult_steps) > 5 else mult_steps,  # Limit for brevity
-        'total_operations': len(mult_steps),
-        'explanation': 'Public key Q is computed by scalar multiplication of the generator G by private key d. This is a one-way function.'
-    })
+    if verbose:
+        Q, mult_steps, mult_total = curve.scalar_multiply(d, G, show_steps=True, max_steps=5)
+    else:
+        # G is fixed, so reuse its precomputed multiples across requests
+        G_table = get_fixed_base_table(a, b, p, Gx, Gy, n)
+        Q = curve.fixed_base_mul(d, G, G_table)
+    if verbose:
+        steps.append({
+            'step': 1,
+            'title': 'Compute Public Key',
+            'formula': 'Q = d × G',
+            'substitution': f'Q = {d} × ({Gx}, {Gy})',
+            'result': Q,
+            'scalar_multiplication_steps': mult_steps,  # Limited to the first 5 for brevity
+            'total_operations': mult_total,
+            'explanation': 'Public key Q is computed by scalar multiplication of the generator G by private key d. This is a one-way function.'
+        })
     
     # ========================================================================
     # STEP 2: Hash the Message
@@ -574,15 +1074,16 @@ def ecdsa_educational_sign(params: Dict) -> Dict:
     # Reduce modulo n to fit within the curve's subgroup order
     h = hash_message(message)
     e = h % n  # Truncate/reduce to curve order
-    steps.append({
-        'step': 2,
-        'title': 'Hash Message',
-        'formula': 'e = H(m) mod n',
-        'substitution': f'e = SHA-256("{message}") mod {n}',
-        'hash_full': hex(h),
-        'result': e,
-        'explanation': 'Message is hashed and reduced modulo n to fit within the group order.'
-    })
+    if verbose:
+        steps.append({
+            'step': 2,
+            'title': 'Hash Message',
+            'formula': 'e = H(m) mod n',
+            'substitution': f'e = SHA-256("{message}") mod {n}',
+            'hash_full': hex(h),
+            'result': e,
+            'explanation': 'Message is hashed and reduced modulo n to fit within the group order.'
+        })
     
     # ========================================================================
     # STEP 3: Compute k × G (Random Point for Signature)
@@ -591,7 +1092,10 @@ def ecdsa_educational_sign(params: Dict) -> Dict:
     # The nonce k creates randomness - each signature is unique even for same message
     # This prevents signature forgery and protects the private key
     # Computing k×G is easy, but finding k from k×G is computationally infeasible (ECDLP)
-    kG, kG_steps = curve.scalar_multiply(k, G, show_steps=True)
+    if verbose:
+        kG, kG_steps, _ = curve.scalar_multiply(k, G, show_steps=True, max_steps=5)
+    else:
+        kG = curve.fixed_base_mul(k, G, G_table)
     
     # Validation: k×G must not be point at infinity
     if kG is None:
@@ -600,15 +1104,16 @@ def ecdsa_educational_sign(params: Dict) -> Dict:
             'steps': steps
         }
     
-    steps.append({
-        'step': 3,
-        'title': 'Compute k × G',
-        'formula': 'k × G = (x₁, y₁)',
-        'substitution': f'{k} × ({Gx}, {Gy}) = {kG}',
-        'result': kG,
-        'scalar_multiplication_steps': kG_steps[:5] if len(kG_steps) > 5 else kG_steps,
-        'explanation': 'The nonce k creates randomness. Computing k×G is easy, but finding k from k×G is computationally infeasible (ECDLP).'
-    })
+    if verbose:
+        steps.append({
+            'step': 3,
+            'title': 'Compute k × G',
+            'formula': 'k × G = (x₁, y₁)',
+            'substitution': f'{k} × ({Gx}, {Gy}) = {format_point(kG)}',
+            'result': kG,
+            'scalar_multiplication_steps': kG_steps,
+            'explanation': 'The nonce k creates randomness. Computing k×G is easy, but finding k from k×G is computationally infeasible (ECDLP).'
+        })
     
     # ========================================================================
     # STEP 4: Compute r (First Part of Signature)
@@ -632,15 +1137,16 @@ def ecdsa_educational_sign(params: Dict) -> Dict:
     # Needed to "undo" the effect of k in the signature equation
     # This is why k must NEVER be reused - if k is known, the private key can be recovered
     k_inv = mod_inverse(k, n)
-    steps.append({
-        'step': 5,
-        'title': 'Compute Modular Inverse of k',
-        'formula': 'k⁻¹ mod n',
-        'substitution': f'{k}⁻¹ mod {n}',
-        'result': k_inv,
-        'verification': f'({k} × {k_inv}) mod {n} = {(k * k_inv) % n}',
-        'explanation': 'The modular inverse is needed to compute s. This is why k must NEVER be reused across signatures.'
-    })
+    if verbose:
+        steps.append({
+            'step': 5,
+            'title': 'Compute Modular Inverse of k',
+            'formula': 'k⁻¹ mod n',
+            'substitution': f'{k}⁻¹ mod {n}',
+            'result': k_inv,
+            'verification': f'({k} × {k_inv}) mod {n} = {(k * k_inv) % n}',
+            'explanation': 'The modular inverse is needed to compute s. This is why k must NEVER be reused across signatures.'
+        })
     
     # ========================================================================
     # STEP 6: Compute s (Second Part of Signature)
@@ -651,24 +1157,25 @@ def ecdsa_educational_sign(params: Dict) -> Dict:
     #   - The private key d (hidden in the computation)
     #   - The randomness r
     # Only someone with private key d can compute a valid s
-    dr = (d * r) % n          # Private key × r
-    e_plus_dr = (e + dr) % n  # Hash + (private key × r)
-    s = (k_inv * e_plus_dr) % n  # Final signature component
-    
-    # Validation: s must be non-zero
-    steps.append({
-        'step': 6,
-        'title': 'Compute s',
-        'formula': 's = k⁻¹(e + d×r) mod n',
-        'substitution': f's = {k_inv}×({e} + {d}×{r}) mod {n}',
-        'intermediate_steps': [
-            f'd×r = {d}×{r} = {dr} mod {n}',
-            f'e + d×r = {e} + {dr} = {e_plus_dr} mod {n}',
-            f's = {k_inv}×{e_plus_dr} = {s} mod {n}'
-        ],
-        'result': s,
-        'explanation': 's binds the hash, private key, and r together. Only someone with private key d can compute valid s.'
-    })
+    s = (k_inv * (e + d * r)) % n  # Single reduction for the whole expression
+    
+    if verbose:
+        # Intermediate values are only needed for the step-by-step display
+        dr = (d * r) % n          # Private key × r
+        e_plus_dr = (e + dr) % n  # Hash + (private key × r)
+        steps.append({
+            'step': 6,
+            'title': 'Compute s',
+            'formula': 's = k⁻¹(e + d×r) mod n',
+            'substitution': f's = {k_inv}×({e} + {d}×{r}) mod {n}',
+            'intermediate_steps': [
+                f'd×r = {d}×{r} = {dr} mod {n}',
+                f'e + d×r = {e} + {dr} = {e_plus_dr} mod {n}',
+                f's = {k_inv}×{e_plus_dr} = {s} mod {n}'
+            ],
+            'result': s,
+            'explanation': 's binds the hash, private key, and r together. Only someone with private key d can compute valid s.'
+        })
     
     if s == 0:
         return {
@@ -724,23 +1231,25 @@ def ecdsa_educational_verify(params: Dict) -> Dict:
     - Qx, Qy: Public key point
     - r, s: Signature components
     - message: Original message
+    - verbose: include the step-by-step explanation (default True)
     """
-    a = int(params['a'])
-    b = int(params['b'])
-    p = int(params['p'])
-    Gx = int(params['Gx'])
-    Gy = int(params['Gy'])
-    n = int(params['n'])
-    Qx = int(params['Qx'])
-    Qy = int(params['Qy'])
-    r = int(params['r'])
-    s = int(params['s'])
+    a = mpz(int(params['a']))
+    b = mpz(int(params['b']))
+    p = mpz(int(params['p']))
+    Gx = mpz(int(params['Gx']))
+    Gy = mpz(int(params['Gy']))
+    n = mpz(int(params['n']))
+    Qx = mpz(int(params['Qx']))
+    Qy = mpz(int(params['Qy']))
+    r = mpz(int(params['r']))
+    s = mpz(int(params['s']))
     message = params['message']
+    verbose = parse_flag(params.get('verbose', True))  # False skips building the step-by-step explanation
     
     steps = []
     
     # Create the elliptic curve
-    curve = EllipticCurve(a, b, p)
+    curve = get_curve(a, b, p)
     G = (Gx, Gy)
     Q = (Qx, Qy)
     
@@ -756,142 +1265,148 @@ def ecdsa_educational_verify(params: Dict) -> Dict:
             'steps': []
         }
     
-    steps.append({
-        'step': 0,
-        'title': 'Setup',
-        'curve_equation': f'y² = x³ + {a}x + {b} (mod {p})',
-        'generator': f'G = ({Gx}, {Gy})',
-        'public_key': f'Q = ({Qx}, {Qy})',
-        'explanation': 'Verify curve parameters and points are valid.'
-    })
+    if verbose:
+        steps.append({
+            'step': 0,
+            'title': 'Setup',
+            'curve_equation': f'y² = x³ + {a}x + {b} (mod {p})',
+            'generator': f'G = ({Gx}, {Gy})',
+            'public_key': f'Q = ({Qx}, {Qy})',
+            'explanation': 'Verify curve parameters and points are valid.'
+        })
     
     # ========================================================================
     # STEP 1: Hash the Message
     # ========================================================================
     h = hash_message(message)
     e = h % n
-    steps.append({
-        'step': 1,
-        'title': 'Hash Message',
-        'formula': 'e = H(m) mod n',
-        'substitution': f'e = SHA-256("{message}") mod {n}',
-        'result': e,
-        'hash_full': hex(h),
-        'explanation': 'Hash the message the same way as during signing.'
-    })
+    if verbose:
+        steps.append({
+            'step': 1,
+            'title': 'Hash Message',
+            'formula': 'e = H(m) mod n',
+            'substitution': f'e = SHA-256("{message}") mod {n}',
+            'result': e,
+            'hash_full': hex(h),
+            'explanation': 'Hash the message the same way as during signing.'
+        })
     
     # ========================================================================
     # STEP 2: Compute w = s^(-1) mod n
     # ========================================================================
     w = mod_inverse(s, n)
-    steps.append({
-        'step': 2,
-        'title': 'Compute w = s^(-1) mod n',
-        'formula': 'w = s^(-1) mod n',
-        'substitution': f'w = {s}^(-1) mod {n}',
-        'result': w,
-        'verification': f'({s} × {w}) mod {n} = {(s * w) % n}',
-        'explanation': 'Compute the modular inverse of s to "undo" its effect.'
-    })
+    if verbose:
+        steps.append({
+            'step': 2,
+            'title': 'Compute w = s^(-1) mod n',
+            'formula': 'w = s^(-1) mod n',
+            'substitution': f'w = {s}^(-1) mod {n}',
+            'result': w,
+            'verification': f'({s} × {w}) mod {n} = {(s * w) % n}',
+            'explanation': 'Compute the modular inverse of s to "undo" its effect.'
+        })
     
     # ========================================================================
     # STEP 3: Compute u₁ = e × w mod n
     # ========================================================================
     u1 = (e * w) % n
-    steps.append({
-        'step': 3,
-        'title': 'Compute u₁',
-        'formula': 'u₁ = e × w mod n',
-        'substitution': f'u₁ = {e} × {w} mod {n}',
-        'result': u1,
-        'explanation': 'First verification component combines message hash and w.'
-    })
+    if verbose:
+        steps.append({
+            'step': 3,
+            'title': 'Compute u₁',
+            'formula': 'u₁ = e × w mod n',
+            'substitution': f'u₁ = {e} × {w} mod {n}',
+            'result': u1,
+            'explanation': 'First verification component combines message hash and w.'
+        })
     
     # ========================================================================
     # STEP 4: Compute u₂ = r × w mod n
     # ========================================================================
     u2 = (r * w) % n
-    steps.append({
-        'step': 4,
-        'title': 'Compute u₂',
-        'formula': 'u₂ = r × w mod n',
-        'substitution': f'u₂ = {r} × {w} mod {n}',
-        'result': u2,
-        'explanation': 'Second verification component combines r and w.'
-    })
+    if verbose:
+        steps.append({
+            'step': 4,
+            'title': 'Compute u₂',
+            'formula': 'u₂ = r × w mod n',
+            'substitution': f'u₂ = {r} × {w} mod {n}',
+            'result': u2,
+            'explanation': 'Second verification component combines r and w.'
+        })
     
     # ========================================================================
     # STEP 5: Compute u₁×G
     # ========================================================================
-    u1G, u1G_steps = curve.scalar_multiply(u1, G, show_steps=True)
-    if u1G is None:
-        return {
-            'error': 'u₁×G resulted in point at infinity',
-            'steps': steps
-        }
-    steps.append({
-        'step': 5,
-        'title': 'Compute u₁×G',
-        'formula': 'u₁ × G',
-        'substitution': f'{u1} × ({Gx}, {Gy})',
-        'result': u1G,
-        'scalar_multiplication_steps': u1G_steps[:5] if len(u1G_steps) > 5 else u1G_steps,
-        'explanation': 'First point component for verification.'
-    })
+    # Either product may be the point at infinity (None); point_add handles
+    # that, and only the sum in step 7 has to be a finite point
+    if verbose:
+        u1G, u1G_steps, _ = curve.scalar_multiply(u1, G, show_steps=True, max_steps=5)
+        steps.append({
+            'step': 5,
+            'title': 'Compute u₁×G',
+            'formula': 'u₁ × G',
+            'substitution': f'{u1} × ({Gx}, {Gy})',
+            'result': u1G,
+            'scalar_multiplication_steps': u1G_steps,
+            'explanation': 'First point component for verification.'
+        })
     
     # ========================================================================
     # STEP 6: Compute u₂×Q
     # ========================================================================
-    u2Q, u2Q_steps = curve.scalar_multiply(u2, Q, show_steps=True)
-    if u2Q is None:
-        return {
-            'error': 'u₂×Q resulted in point at infinity',
-            'steps': steps
-        }
-    steps.append({
-        'step': 6,
-        'title': 'Compute u₂×Q',
-        'formula': 'u₂ × Q',
-        'substitution': f'{u2} × ({Qx}, {Qy})',
-        'result': u2Q,
-        'scalar_multiplication_steps': u2Q_steps[:5] if len(u2Q_steps) > 5 else u2Q_steps,
-        'explanation': 'Second point component for verification.'
-    })
+    if verbose:
+        u2Q, u2Q_steps, _ = curve.scalar_multiply(u2, Q, show_steps=True, max_steps=5)
+        steps.append({
+            'step': 6,
+            'title': 'Compute u₂×Q',
+            'formula': 'u₂ × Q',
+            'substitution': f'{u2} × ({Qx}, {Qy})',
+            'result': u2Q,
+            'scalar_multiplication_steps': u2Q_steps,
+            'explanation': 'Second point component for verification.'
+        })
     
     # ========================================================================
     # STEP 7: Compute (x, y) = u₁×G + u₂×Q
     # ========================================================================
-    verification_point = curve.point_add(u1G, u2Q)
+    if verbose:
+        verification_point = curve.point_add(u1G, u2Q)
+    else:
+        # Without the step display, compute u₁×G + u₂×Q in a single pass
+        # that shares one doubling chain between both scalars
+        verification_point = curve.shamir_mul(u1, G, u2, Q)
     if verification_point is None:
         return {
             'error': 'u₁×G + u₂×Q resulted in point at infinity',
             'steps': steps
         }
     vx, vy = verification_point
-    steps.append({
-        'step': 7,
-        'title': 'Compute Verification Point',
-        'formula': '(x, y) = u₁×G + u₂×Q',
-        'substitution': f'(x, y) = {u1G} + {u2Q}',
-        'result': verification_point,
-        'explanation': 'Add the two point components to get the verification point.'
-    })
+    if verbose:
+        steps.append({
+            'step': 7,
+            'title': 'Compute Verification Point',
+            'formula': '(x, y) = u₁×G + u₂×Q',
+            'substitution': f'(x, y) = {format_point(u1G)} + {format_point(u2Q)}',
+            'result': verification_point,
+            'explanation': 'Add the two point components to get the verification point.'
+        })
     
     # ========================================================================
     # STEP 8: Verify x mod n = r
     # ========================================================================
     v = vx % n
     is_valid = (v == r)
-    steps.append({
-        'step': 8,
-        'title': 'Verify Signature',
-        'formula': 'x mod n = r?',
-        'substitution': f'{vx} mod {n} = {r}?',
-        'result': '✅ VALID' if is_valid else '❌ INVALID',
-        'verification_value': v,
-        'expected_value': r,
-        'explanation': 'Signature is valid if x-coordinate mod n equals r. This proves the signature was created by someone with the private key.'
-    })
+    if verbose:
+        steps.append({
+            'step': 8,
+            'title': 'Verify Signature',
+            'formula': 'x mod n = r?',
+            'substitution': f'{vx} mod {n} = {r}?',
+            'result': '✅ VALID' if is_valid else '❌ INVALID',
+            'verification_value': v,
+            'expected_value': r,
+            'explanation': 'Signature is valid if x-coordinate mod n equals r. This proves the signature was created by someone with the private key.'
+        })
     
     return {
         'success': True,
@@ -909,6 +1424,35 @@ def ecdsa_educational_verify(params: Dict) -> Dict:
 # ECDSA IMPLEMENTATION (Real/Secure Mode)
 # ============================================================================
 
+# The signature algorithm object is stateless, so one instance serves every request
+ECDSA_SHA256 = ec.ECDSA(hashes.SHA256()) if ec is not None else None
+
+# Supported curves, built once instead of on every request
+_CURVE_MAP = {
+    'secp256k1': ec.SECP256K1(),
+    'secp256r1': ec.SECP256R1(),
+    'secp384r1': ec.SECP384R1(),
+    'secp521r1': ec.SECP521R1(),
+} if ec is not None else {}
+
+def _do_sign(curve, message_bytes: bytes) -> Tuple[bytes, bytes]:
+    """
+    Generate a fresh key pair on curve and sign message_bytes
+    Returns (DER signature, uncompressed X9.62 public key)
+    """
+    private_key = ec.generate_private_key(curve, default_backend())
+    
+    # Serialize public key for display
+    public_bytes = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.X962,
+        format=serialization.PublicFormat.UncompressedPoint
+    )
+    
+    # Sign message using deterministic ECDSA (RFC 6979)
+    signature = private_key.sign(message_bytes, ECDSA_SHA256)
+    return signature, public_bytes
+
+
 def ecdsa_real_sign(params: Dict) -> Dict:
     """
     Real-world ECDSA signature generation using secure parameters
@@ -916,12 +1460,7 @@ def ecdsa_real_sign(params: Dict) -> Dict:
     
     This implementation uses the cryptography library for production-grade ECDSA
     """
-    try:
-        from cryptography.hazmat.primitives.asymmetric import ec
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.backends import default_backend
-    except ImportError:
+    if ec is None:
         return {
             'error': 'cryptography library not installed. Run: pip install cryptography',
             'steps': []
@@ -930,62 +1469,21 @@ def ecdsa_real_sign(params: Dict) -> Dict:
     message = params['message']
     curve_name = params.get('curve', 'secp256k1')
     
-    # Map curve names
-    curve_map = {
-        'secp256k1': ec.SECP256K1(),
-        'secp256r1': ec.SECP256R1(),
-        'secp384r1': ec.SECP384R1(),
-        '   ': ec.SECP521R1(),
-    }
-    
-    if curve_name not in curve_map:
+    curve = _CURVE_MAP.get(curve_name)
+    if curve is None:
         return {
-            'error': f'Unsupported curve. Choose from: {list(curve_map.keys())}',
+            'error': f'Unsupported curve. Choose from: {list(_CURVE_MAP.keys())}',
             'steps': []
         }
     
-    curve = curve_map[curve_name]
-    
-    # Generate private key (or use provided one)
-    if 'private_key_hex' in params:
-        # Use provided private key
-        try:
-            private_key_int = int(params['private_key_hex'], 16)
-            # This is simplified - proper private key loading is more complex
-            private_key = ec.generate_private_key(curve, default_backend())
-        except:
-            private_key = ec.generate_private_key(curve, default_backend())
-    else:
-        # Generate new private key
-        private_key = ec.generate_private_key(curve, default_backend())
-    
-    # Get public key
-    public_key = private_key.public_key()
-    
-    # Serialize public key for display
-    public_bytes = public_key.public_bytes(
-        encoding=serialization.Encoding.X962,
-        format=serialization.PublicFormat.UncompressedPoint
-    )
-    
-    # Sign message using deterministic ECDSA (RFC 6979)
-    signature = private_key.sign(
-        message.encode(),
-        ec.ECDSA(hashes.SHA256())
-    )
+    # Provided keys (private_key_hex) are not loaded yet; a new key is
+    # generated either way
+    signature, public_bytes = _do_sign(curve, message.encode())
     
     # Parse signature (DER format)
     # Signature is in DER format, we need to extract r and s
-    from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
     r, s = decode_dss_signature(signature)
     
-    # Get private key bytes (for optional display)
-    private_bytes = private_key.private_bytes(
-        encoding=serialization.Encoding.DER,
-        format=serialization.PrivateFormat.PKCS8,
-        encryption_algorithm=serialization.NoEncryption()
-    )
-    
     return {
         'success': True,
         'mode': 'PRODUCTION ECDSA',
@@ -1016,14 +1514,7 @@ def ecdsa_real_verify(params: Dict) -> Dict:
     """
     Verify an ECDSA signature using real cryptographic libraries
     """
-    try:
-        from cryptography.hazmat.primitives.asymmetric import ec
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.backends import default_backend
-        from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
-        from cryptography.exceptions import InvalidSignature
-    except ImportError:
+    if ec is None:
         return {
             'error': 'cryptography library not installed',
             'success': False
@@ -1035,16 +1526,15 @@ def ecdsa_real_verify(params: Dict) -> Dict:
     r = int(params['r'], 16) if isinstance(params['r'], str) else params['r']
     s = int(params['s'], 16) if isinstance(params['s'], str) else params['s']
     
-    # Reconstruct public key
-    curve_map = {
-        'secp256k1': ec.SECP256K1(),
-        'secp256r1': ec.SECP256R1(),
-        'secp384r1': ec.SECP384R1(),
-        'secp521r1': ec.SECP521R1(),
-    }
+    curve = _CURVE_MAP.get(curve_name)
+    if curve is None:
+        return {
+            'success': False,
+            'error': f'Unsupported curve. Choose from: {list(_CURVE_MAP.keys())}'
+        }
     
+    # Reconstruct public key
     try:
-        curve = curve_map[curve_name]
         public_key_bytes = bytes.fromhex(public_key_hex)
         public_key = ec.EllipticCurvePublicKey.from_encoded_point(curve, public_key_bytes)
         
@@ -1056,7 +1546,7 @@ def ecdsa_real_verify(params: Dict) -> Dict:
             public_key.verify(
                 signature,
                 message.encode(),
-                ec.ECDSA(hashes.SHA256())
+                ECDSA_SHA256
             )
             return {
                 'success': True,
@@ -1080,6 +1570,42 @@ def ecdsa_real_verify(params: Dict) -> Dict:
 # FLASK API ROUTES
 # ============================================================================
 
+def get_educational_params() -> Dict:
+    """
+    Read the JSON body of an educational request
+    A ?verbose=0 (or false) query parameter overrides "verbose" in the body;
+    like "verbose": false it drops the whole step list, not just its details.
+    """
+    params = request.get_json()
+    if 'verbose' in request.args and isinstance(params, dict):
+        params['verbose'] = parse_flag(request.args['verbose'])
+    return params
+
+
+# Responses smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 1024
+
+
+@app.after_request
+def gzip_response(response):
+    """
+    Gzip JSON responses for clients that accept it
+    Step-by-step payloads repeat the same keys and explanation texts in
+    every step and shrink to roughly a quarter of their size.
+    """
+    if (response.mimetype != 'application/json' or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or request.accept_encodings['gzip'] <= 0):
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
 @app.route('/')
 def home():
     """API home endpoint"""
@@ -1099,7 +1625,7 @@ def home():
 def api_dsa_educational_sign():
     """Educational DSA signature generation endpoint"""
     try:
-        params = request.get_json()
+        params = get_educational_params()
         result = dsa_educational_sign(params)
         # If result contains an error, return 400 status
         if 'error' in result and not result.get('success', False):
@@ -1113,7 +1639,7 @@ def api_dsa_educational_sign():
 def api_dsa_educational_verify():
     """Educational DSA signature verification endpoint"""
     try:
-        params = request.get_json()
+        params = get_educational_params()
         result = dsa_educational_verify(params)
         # If result contains an error, return 400 status
         if 'error' in result and not result.get('success', False):
@@ -1127,7 +1653,7 @@ def api_dsa_educational_verify():
 def api_ecdsa_educational_sign():
     """Educational ECDSA signature generation endpoint"""
     try:
-        params = request.get_json()
+        params = get_educational_params()
         result = ecdsa_educational_sign(params)
         # If result contains an error, return 400 status
         if 'error' in result and not result.get('success', False):
@@ -1141,7 +1667,7 @@ def api_ecdsa_educational_sign():
 def api_ecdsa_educational_verify():
     """Educational ECDSA signature verification endpoint"""
     try:
-        params = request.get_json()
+        params = get_educational_params()
         result = ecdsa_educational_verify(params)
         # If result contains an error, return 400 status
         if 'error' in result and not result.get('success', False):
@@ -0,0 +1,133 @@
+"""
+Regression checks for the fast arithmetic paths in app.py
+Each optimized routine is compared against the plain reference: the traced
+double-and-add for elliptic-curve points, built-in pow for modular powers.
+
+Run from backend/: python -m unittest test_arithmetic
+"""
+
+import random
+import unittest
+
+from app import (EllipticCurve, get_dsa_params, get_fixed_base_table, multi_pow_mod,
+                 pow_mod_product)
+
+
+# secp256k1
+P256K1 = 2**256 - 2**32 - 977
+N256K1 = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+G256K1 = (0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+          0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
+
+# Toy curves (a, b, p), small enough to enumerate every point
+TOY_CURVES = [(2, 3, 97), (0, 7, 223), (-3, 5, 101)]
+
+
+def reference_mul(curve, k, P):
+    """k × P via the traced double-and-add"""
+    return curve.scalar_multiply(k, P, show_steps=True)[0]
+
+
+def curve_points(curve, limit):
+    """First `limit` affine points of a toy curve"""
+    p = int(curve.p)
+    points = [(x, y) for x in range(p) for y in range(p) if curve.is_on_curve((x, y))]
+    return points[:limit]
+
+
+def as_ints(point):
+    """Normalize a point (possibly holding mpz values) for comparison"""
+    return None if point is None else (int(point[0]), int(point[1]))
+
+
+class EllipticCurveTests(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+        self.secp256k1 = EllipticCurve(0, 7, P256K1)
+
+    def big_scalars(self, count):
+        return [1, 2, N256K1 - 1, N256K1] + [self.rng.randrange(1, N256K1) for _ in range(count)]
+
+    def test_scalar_multiply_jacobian_matches_reference(self):
+        for a, b, p in TOY_CURVES:
+            curve = EllipticCurve(a, b, p)
+            for P in curve_points(curve, 8):
+                for k in range(60):
+                    expected = as_ints(reference_mul(curve, k, P))
+                    for w in (2, 3, 4, 5):
+                        self.assertEqual(as_ints(curve.scalar_multiply_jacobian(k, P, w)), expected,
+                                         (a, b, p, P, k, w))
+        for k in self.big_scalars(4):
+            self.assertEqual(as_ints(self.secp256k1.scalar_multiply_jacobian(k, G256K1)),
+                             as_ints(reference_mul(self.secp256k1, k, G256K1)))
+
+    def test_fixed_base_mul_matches_reference(self):
+        cases = [(2, 3, 97, (3, 6), 5, range(120)), (0, 7, 223, (47, 71), 233, range(300))]
+        for a, b, p, G, n, scalars in cases:
+            curve = EllipticCurve(a, b, p)
+            table = get_fixed_base_table(a, b, p, G[0], G[1], n)
+            for k in scalars:
+                self.assertEqual(as_ints(curve.fixed_base_mul(k, G, table)),
+                                 as_ints(reference_mul(curve, k, G)), (p, k))
+        table = get_fixed_base_table(0, 7, P256K1, G256K1[0], G256K1[1], N256K1)
+        # includes scalars wider than the table (fallback path)
+        for k in self.big_scalars(4) + [N256K1 + 5, 2**300 + 1]:
+            self.assertEqual(as_ints(self.secp256k1.fixed_base_mul(k, G256K1, table)),
+                             as_ints(reference_mul(self.secp256k1, k, G256K1)))
+
+    def test_shamir_mul_matches_reference(self):
+        curve = EllipticCurve(2, 3, 97)
+        points = curve_points(curve, 6) + [None]
+        for P in points:
+            for Q in points:
+                for u1 in range(10):
+                    for u2 in range(10):
+                        expected = curve.point_add(reference_mul(curve, u1, P),
+                                                   reference_mul(curve, u2, Q))
+                        self.assertEqual(as_ints(curve.shamir_mul(u1, P, u2, Q)), as_ints(expected),
+                                         (P, Q, u1, u2))
+        Q = reference_mul(self.secp256k1, 12345, G256K1)
+        for _ in range(3):
+            u1, u2 = self.rng.randrange(N256K1), self.rng.randrange(N256K1)
+            expected = self.secp256k1.point_add(reference_mul(self.secp256k1, u1, G256K1),
+                                                reference_mul(self.secp256k1, u2, Q))
+            self.assertEqual(as_ints(self.secp256k1.shamir_mul(u1, G256K1, u2, Q)), as_ints(expected))
+
+    def test_negative_scalars_are_rejected(self):
+        curve = EllipticCurve(2, 3, 97)
+        table = get_fixed_base_table(2, 3, 97, 3, 6, 5)
+        with self.assertRaises(ValueError):
+            curve.scalar_multiply_jacobian(-1, (3, 6))
+        with self.assertRaises(ValueError):
+            curve.fixed_base_mul(-1, (3, 6), table)
+        with self.assertRaises(ValueError):
+            curve.shamir_mul(-1, (3, 6), 1, (3, 6))
+
+
+class ModularPowerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(99)
+
+    def test_dsa_pow_g_matches_pow(self):
+        # toy parameters, and a 2048-bit prime modulus with a large exponent range
+        p2048 = 2**2048 - 1942289  # prime
+        for p, q, g in [(23, 11, 4), (283, 47, 60), (p2048, 2**256, 3)]:
+            params = get_dsa_params(p, q, g)
+            exponents = list(range(60)) + [q - 1, q, q + 1] + [self.rng.randrange(q) for _ in range(10)]
+            for e in exponents:
+                self.assertEqual(params.pow_g(e), pow(g, e, p), (p, e))
+
+    def test_pow_mod_product_matches_pow(self):
+        for mod in (1, 2, 23, 283, 2**127 - 1, 2**1279 - 1):
+            for _ in range(10):
+                b1, b2 = self.rng.randrange(mod + 1), self.rng.randrange(mod + 1)
+                e1, e2 = self.rng.randrange(2 * mod + 2), self.rng.randrange(2 * mod + 2)
+                expected = pow(b1, e1, mod) * pow(b2, e2, mod) % mod
+                self.assertEqual(pow_mod_product(b1, e1, b2, e2, mod), expected, (mod, b1, e1, b2, e2))
+                self.assertEqual(multi_pow_mod(b1, e1, b2, e2, mod), expected, (mod, b1, e1, b2, e2))
+
+
+if __name__ == '__main__':
+    unittest.main()